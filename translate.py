@@ -2,12 +2,19 @@ import json
 import logging
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from bs4 import BeautifulSoup, NavigableString, Comment
-from bs4.element import Tag
+from bs4 import BeautifulSoup, NavigableString, FeatureNotFound
+from bs4.element import Tag, TemplateString, RubyTextString, RubyParenthesisString
 from bs4.formatter import HTMLFormatter, EntitySubstitution
 import re
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
 
 class Roll20Formatter(HTMLFormatter):
     """
@@ -21,6 +28,10 @@ class Roll20Formatter(HTMLFormatter):
     the JSON as invalid. Forcing &quot; inside double-quoted attributes keeps
     the markup valid; the browser decodes &quot; back to " so the value still
     matches the exact key in translations.json.
+
+    Boolean attributes (readonly, hidden, ...) are written bare instead of
+    readonly="" / readonly="readonly", and <input> keeps its original
+    unclosed style (<input ...> rather than <input .../>).
     """
     def __init__(self):
         super().__init__(entity_substitution=EntitySubstitution.substitute_xml)
@@ -28,13 +39,21 @@ class Roll20Formatter(HTMLFormatter):
     def quoted_attribute_value(self, value):
         return '"' + value.replace('"', '&quot;') + '"'
 
+    def attributes(self, tag):
+        # BeautifulSoup asks for a tag's attributes right before it writes the
+        # void-element closing slash, so pick the slash for this tag here
+        self.void_element_close_prefix = '' if tag.name == 'input' else '/'
+        # A None value makes BeautifulSoup emit just the attribute name
+        return [
+            (key, None if key in BOOLEAN_ATTRIBUTES and value in ('', key) else value)
+            for key, value in super().attributes(tag)
+        ]
 
-# Global dictionary to store unique translation keys
-translation_keys = {}
 
 # Configuration
-SKIPPED_TAGS = {'br', 'hr', 'script', 'style', 'meta', 'link'}
-PRESERVED_FORMATTING_TAGS = {'b', 'i', 'strong', 'em', 'u', 'code', 'kbd', 'mark', 'small', 'sub', 'sup', 'p'}
+SKIPPED_TAGS = frozenset({'br', 'hr', 'script', 'style', 'meta', 'link'})
+PRESERVED_FORMATTING_TAGS = frozenset({'b', 'i', 'strong', 'em', 'u', 'code', 'kbd', 'mark', 'small', 'sub', 'sup', 'p'})
+INPUT_TAGS = frozenset({'input', 'select', 'textarea', 'button'})  # Form controls that mark mixed content
 TEMPLATE_PATTERNS = [r'{{', r'@{', r'%{', r'\${', r'#{']  # Common template syntax patterns
 # REMOVED 'value' from translatable attributes - values should NOT be translated
 TRANSLATABLE_ATTRIBUTES = {
@@ -44,49 +63,86 @@ TRANSLATABLE_ATTRIBUTES = {
     'aria-label': 'data-i18n-aria-label',
     'aria-description': 'data-i18n-aria-description'
 }
+BOOLEAN_ATTRIBUTES = frozenset({'readonly', 'hidden', 'disabled', 'checked', 'selected', 'multiple', 'required'})
+IO_BUFFER_SIZE = 1 << 20  # Sheets are several MB; read/write them in large chunks
+# Letters (including Polish) that make a text worth translating
+LETTERS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzĄąĆćĘęŁłŃńÓóŚśŹźŻż')
+
+_TRANSLATABLE_ATTRIBUTE_NAMES = frozenset(TRANSLATABLE_ATTRIBUTES)
+# Exact classes of translatable text nodes. Matching type() against these is
+# cheaper than isinstance() and leaves out Comment, CData, Doctype etc.
+_TEXT_NODE_TYPES = frozenset({NavigableString, TemplateString, RubyTextString, RubyParenthesisString})
+
+# Precompiled patterns - these run once per text node / attribute, so avoid
+# re-parsing the pattern strings on every call
+_NEWLINE_TAB_RE = re.compile(r'[\n\t\r]+')
+_TEMPLATE_RE = re.compile('|'.join(TEMPLATE_PATTERNS))
+_WORD_RE = re.compile(r'[A-Za-zĄąĆćĘęŁłŃńÓóŚśŹźŻż]{2,}')
+_MACRO_BLOCK_RE = re.compile(r'\{\{[^{}]*\}\}')
+_MACRO_TOKEN_RE = re.compile(r'[@%?$#]\{[^{}]*\}')
+# Comments, raw-text elements and other complete start tags (with their
+# quoted attribute values) are matched too, so that a "<body>" inside them
+# is consumed there and never counts as a document tag
+_DOCUMENT_TAG_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style|textarea|title)\b.*?</\1\s*>'
+    r'|<(html|head|body)[\s/>]'
+    r'|<[a-zA-Z][^>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^>"\']*)*>',
+    re.IGNORECASE | re.DOTALL
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8192)
 def normalize_text(text):
     """
     Normalize input by preserving multiple spaces but trimming edges.
     Only collapse newlines and tabs to single space.
     """
+    # Most values are single-line; str.strip() alone is enough for them
+    if '\n' not in text and '\t' not in text and '\r' not in text:
+        return text.strip()
     # Replace newlines and tabs with single space, but preserve multiple spaces
-    text = re.sub(r'[\n\t\r]+', ' ', text)
+    text = _NEWLINE_TAB_RE.sub(' ', text)
     return text.strip()
 
+@lru_cache(maxsize=4096)
 def has_template_syntax(text):
     """
     Check if text contains template syntax that shouldn't be translated.
     """
-    for pattern in TEMPLATE_PATTERNS:
-        if re.search(pattern, text):
-            return True
-    return False
+    # Every template pattern contains a brace; most sheet text has none
+    if '{' not in text:
+        return False
+    return _TEMPLATE_RE.search(text) is not None
 
+@lru_cache(maxsize=4096)
 def should_translate(text):
     """
     Return True if text contains letters (including Polish) and no template syntax.
     Skip single characters to avoid unnecessary translations.
     """
+    # Cheap checks first: too short to be more than one character, or a bare
+    # number, can be rejected without scanning for templates or letters
+    if len(text) <= 1:
+        return False
     stripped = text.strip()
     # Skip single characters
-    if len(stripped) <= 1:
+    if len(stripped) <= 1 or stripped.isdigit():
         return False
     if has_template_syntax(text):
         return False
-    return bool(re.search(r'[A-Za-zĄąĆćĘęŁłŃńÓóŚśŹźŻż]', stripped))
+    return not LETTERS.isdisjoint(stripped)
 
 def strip_template_macros(text):
     """
     Remove Roll20 macro tokens (@{...}, %{...}, ?{...}, {{...}}, ${...}, #{...})
     so we can inspect the remaining human-readable text.
     """
-    text = re.sub(r'\{\{[^{}]*\}\}', '', text)
-    text = re.sub(r'[@%?$#]\{[^{}]*\}', '', text)
+    text = _MACRO_BLOCK_RE.sub('', text)
+    text = _MACRO_TOKEN_RE.sub('', text)
     return text
 
 def should_translate_attr(text):
@@ -101,32 +157,49 @@ def should_translate_attr(text):
     stripped = text.strip()
     if len(stripped) <= 1:
         return False
-    rest = strip_template_macros(stripped)
-    return bool(re.search(r'[A-Za-zĄąĆćĘęŁłŃńÓóŚśŹźŻż]{2,}', rest))
+    # Every macro token contains a brace
+    rest = strip_template_macros(stripped) if '{' in stripped else stripped
+    return bool(_WORD_RE.search(rest))
 
-def add_translation_key(key):
+@lru_cache(maxsize=4096)
+def classify_attr(text):
     """
-    Register a translation key if new.
+    Return the normalized attribute value if it should be translated,
+    otherwise None. Checks and normalizes in one memoized call, since
+    titles and placeholders repeat all over a sheet.
     """
-    norm = normalize_text(key)
-    if norm not in translation_keys:
-        logger.debug(f"Added translation key: {norm}")
-        translation_keys[norm] = norm
+    if should_translate_attr(text):
+        return normalize_text(text)
+    return None
 
-def wrap_text_with_whitespace(text, soup):
+def _add_normalized(norm, keys):
+    """
+    Register an already normalized translation key in the keys set if new.
+    """
+    if norm not in keys:
+        logger.debug("Added translation key: %s", norm)
+        keys.add(norm)
+
+def wrap_text_with_whitespace(text, soup, keys):
     """
     Given a text node string, split into leading ws, core, trailing ws,
     wrap core in <span data-i18n="..."></span>, and return list of nodes.
+    The wrapped key is added to keys.
     """
-    # Separate leading/trailing whitespace
-    m = re.match(r'^(\s*)(.*?)(\s*)$', text, re.DOTALL)
-    leading, core, trailing = m.groups()
+    # Separate leading/trailing whitespace, if there is any at the edges
+    if not text[:1].isspace() and not text[-1:].isspace():
+        leading, core, trailing = '', text, ''
+    else:
+        rest = text.lstrip()
+        leading = text[:len(text) - len(rest)]
+        core = rest.rstrip()
+        trailing = rest[len(core):]
     nodes = []
     if leading:
         nodes.append(NavigableString(leading))
     if core and should_translate(core):
         norm = normalize_text(core)
-        add_translation_key(norm)
+        _add_normalized(norm, keys)
         span = soup.new_tag('span')
         span['data-i18n'] = norm
         # Don't include the original text in the span - it will be replaced by translation
@@ -139,98 +212,126 @@ def wrap_text_with_whitespace(text, soup):
     return nodes
 
 
-def process_tag(tag, soup, config=None):
+def unwrap_fragment(soup, html_content):
     """
-    Recursively wrap text nodes and attributes for translation.
-    Skip configured tags, preserve formatting tags, and skip existing spans.
+    lxml always builds a full document, wrapping fragments (like Roll20
+    sheets) in <html><head><body>. Drop the wrappers the input didn't have.
     """
-    if config is None:
-        config = {}
+    for match in _DOCUMENT_TAG_RE.finditer(html_content):
+        if match.group(2):
+            return
+    for name in ('html', 'head', 'body'):
+        wrapper = soup.find(name)
+        if wrapper is not None:
+            wrapper.unwrap()
 
-    skipped_tags = config.get('skipped_tags', SKIPPED_TAGS)
-    preserved_tags = config.get('preserved_tags', PRESERVED_FORMATTING_TAGS)
 
-    name = tag.name.lower()
+def process_tag(tag, soup, keys, skipped_tags=SKIPPED_TAGS, remove_original_attrs=True):
+    """
+    Wrap text nodes and attributes of a single tag for translation.
+    Skip configured tags, preserve formatting tags, and skip existing spans.
+    Returns the child tags that still need processing (process_html walks
+    them with an explicit stack instead of recursing).
+    New translation keys are added to the keys set; the options are
+    resolved from the config once by process_html.
+    """
+    name = tag.name  # Both html.parser and lxml already lowercase tag names
     if name in skipped_tags:
-        return
-
-    # Process translatable attributes
-    for attr_name, i18n_attr in TRANSLATABLE_ATTRIBUTES.items():
-        if tag.has_attr(attr_name):
-            attr_value = tag[attr_name]
-
-            if attr_value and should_translate_attr(attr_value):
-                norm = normalize_text(attr_value)
-                # BeautifulSoup escapes the attribute value on serialization
-                tag[i18n_attr] = norm
-                # Remove the original attribute to avoid duplication
-                if config.get('remove_original_attrs', True):
-                    del tag[attr_name]
-                add_translation_key(norm)
-                logger.debug(f"Added {attr_name} attribute for translation: {norm}")
+        return []
+    # Look attributes up in the dict directly instead of via tag methods
+    attrs = tag.attrs
+
+    # Process translatable attributes - most tags have none, so check all
+    # names at once before looking at them one by one
+    if not attrs.keys().isdisjoint(_TRANSLATABLE_ATTRIBUTE_NAMES):
+        for attr_name, i18n_attr in TRANSLATABLE_ATTRIBUTES.items():
+            if attr_name in attrs:
+                attr_value = attrs[attr_name]
+
+                norm = classify_attr(attr_value) if attr_value else None
+                if norm is not None:
+                    # BeautifulSoup escapes the attribute value on serialization
+                    attrs[i18n_attr] = norm
+                    # Remove the original attribute to avoid duplication
+                    if remove_original_attrs:
+                        del attrs[attr_name]
+                    _add_normalized(norm, keys)
+                    # Lazy %-style arguments: formatted only when DEBUG is enabled
+                    logger.debug("Added %s attribute for translation: %s", attr_name, norm)
+
+    # Leaf tags (<input>, <img>, empty cells, ...) have nothing more to do
+    if not tag.contents:
+        return []
 
     # Gather all direct text content (excluding child tags)
-    tag_text_content = ''.join([str(c) for c in tag.contents if isinstance(c, NavigableString) and not isinstance(c, Comment)])
+    tag_text_content = ''.join([c for c in tag.contents if type(c) in _TEXT_NODE_TYPES])
 
     # Special handling for OPTION elements - NEVER translate their value attribute
     if name == 'option':
         # Only process the text content of option, never the value
         if tag_text_content and should_translate(tag_text_content):
             norm = normalize_text(tag_text_content)
-            tag['data-i18n'] = norm
+            attrs['data-i18n'] = norm
             tag.clear()  # Clear the content - it will be replaced by translation
-            add_translation_key(norm)
-        return  # Don't process children of option tags
+            _add_normalized(norm, keys)
+        return []  # Don't process children of option tags
 
     # Check if we can add data-i18n directly to this tag
     # This works for tags with only text content or tags where all text should be replaced
     if tag_text_content and should_translate(tag_text_content):
-        has_only_text = all(isinstance(c, NavigableString) for c in tag.contents)
-        child_tags = [c for c in tag.contents if isinstance(c, Tag)]
-
+        # Classify the children in a single pass
         # Special handling for tags with mixed content (text + input elements)
         # If tag has both text and child elements, wrap text in nested spans
-        has_input_children = any(
-            c.name.lower() in {'input', 'select', 'textarea', 'button'}
-            for c in child_tags
-        )
+        child_tags = []
+        has_input_children = False
+        for c in tag.contents:
+            if isinstance(c, Tag):
+                child_tags.append(c)
+                if c.name in INPUT_TAGS:
+                    has_input_children = True
+        has_only_text = not child_tags
 
         if has_input_children and tag_text_content.strip():
             # Mixed content case - wrap text nodes in spans with data-i18n
             # Keep the parent structure intact
             for child in list(tag.contents):
-                if isinstance(child, NavigableString) and not isinstance(child, Comment):
+                if type(child) in _TEXT_NODE_TYPES:
                     text = str(child)
                     if text.strip() and should_translate(text):
                         norm = normalize_text(text)
                         new_span = soup.new_tag('span')
                         new_span['data-i18n'] = norm
                         child.replace_with(new_span)
-                        add_translation_key(norm)
+                        _add_normalized(norm, keys)
             # Process child tags for their attributes
-            for child in child_tags:
-                if isinstance(child, Tag):
-                    process_tag(child, soup, config)
-            return
+            return child_tags
 
         # Simple text-only case - add data-i18n to the tag itself
         if has_only_text:
             norm = normalize_text(tag_text_content)
-            tag['data-i18n'] = norm
+            attrs['data-i18n'] = norm
             # Clear the content - it will be replaced by translation
             tag.clear()
-            add_translation_key(norm)
-            return  # Don't process children since we handled the whole tag
-
-    # Process children normally if we couldn't add data-i18n to the parent
-    for child in list(tag.contents):
-        if isinstance(child, NavigableString) and not isinstance(child, Comment):
+            _add_normalized(norm, keys)
+            return []  # Don't process children since we handled the whole tag
+
+    # Process children normally if we couldn't add data-i18n to the parent.
+    # Wrapping replaces text nodes while looping, so only iterate over a copy
+    # of the children when there is text to wrap
+    children = tag.contents
+    if 'data-i18n' not in attrs and any(
+        type(c) in _TEXT_NODE_TYPES and c.strip()
+        for c in children
+    ):
+        children = list(children)
+    to_visit = []
+    for child in children:
+        if type(child) in _TEXT_NODE_TYPES:
             text = str(child)
             if text.strip():
-                parent = child.parent
                 # skip if parent already has data-i18n
-                if not (isinstance(parent, Tag) and parent.has_attr('data-i18n')):
-                    new_nodes = wrap_text_with_whitespace(text, soup)
+                if 'data-i18n' not in attrs:
+                    new_nodes = wrap_text_with_whitespace(text, soup, keys)
                     child.replace_with(*new_nodes)
                 # else leave as-is
             else:
@@ -238,54 +339,67 @@ def process_tag(tag, soup, config=None):
                 # to preserve formatting, we skip extraction
                 continue
         elif isinstance(child, Tag):
-            child_name = child.name.lower()
+            child_name = child.name
             # Skip if it's a skipped tag
             if child_name in skipped_tags:
                 continue
             # Skip if it's already a translation span
-            if child_name == 'span' and child.has_attr('data-i18n'):
+            if child_name == 'span' and 'data-i18n' in child.attrs:
                 continue
             # For preserved formatting tags, process their content but don't skip them
-            process_tag(child, soup, config)
+            to_visit.append(child)
+
+    return to_visit
 
 
 def process_html(html_content, config=None):
     """
     Parse and process HTML content.
+    Returns the processed document as UTF-8 encoded bytes and the set of
+    translation keys found in it.
     """
     if config is None:
         config = {}
 
     logger.info("Starting HTML processing...")
-    # Use html.parser with specific formatter to preserve original HTML structure
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # html.parser by default to preserve original HTML structure; lxml parses
+    # much faster, but needs the document wrappers it adds to be removed
+    parser = config.get('parser', 'html.parser')
+    try:
+        soup = BeautifulSoup(html_content, parser)
+    except FeatureNotFound:
+        logger.warning(f"Parser '{parser}' is not installed, falling back to html.parser")
+        parser = 'html.parser'
+        soup = BeautifulSoup(html_content, parser)
+    if parser == 'lxml':
+        unwrap_fragment(soup, html_content)
+
+    # Resolve the options once rather than per tag
+    skipped_tags = config.get('skipped_tags', SKIPPED_TAGS)
+    remove_original_attrs = config.get('remove_original_attrs', True)
 
+    # Depth-first walk with an explicit stack: every tag is visited once, and
+    # process_tag hands back the children that still need processing
+    keys = set()
     tags_processed = 0
-    for tag in soup.find_all(True):
-        process_tag(tag, soup, config)
+    stack = soup.find_all(True, recursive=False)
+    stack.reverse()
+    while stack:
+        tag = stack.pop()
         tags_processed += 1
+        stack.extend(reversed(process_tag(tag, soup, keys, skipped_tags, remove_original_attrs)))
 
     logger.info(f"Processed {tags_processed} tags")
-    logger.info(f"Found {len(translation_keys)} unique translation keys")
+    logger.info(f"Found {len(keys)} unique translation keys")
     
-    # Convert back to string with custom formatting.
+    # Encode straight to bytes with custom formatting.
     # Roll20Formatter forces double-quoted attributes with &quot; for embedded
     # quotes, otherwise BeautifulSoup would emit single-quoted attributes that
-    # Roll20's i18n parser rejects.
-    html_output = soup.decode(formatter=Roll20Formatter())
-
-    # Fix boolean attributes that BeautifulSoup converts
-    # Replace readonly="readonly" with readonly, hidden="hidden" with hidden, etc.
-    # Also handle empty string versions
-    boolean_attrs = ['readonly', 'hidden', 'disabled', 'checked', 'selected', 'multiple', 'required']
-    for attr in boolean_attrs:
-        # Handle both attr="attr" and attr="" patterns
-        html_output = re.sub(f'{attr}="{attr}"', attr, html_output)
-        html_output = re.sub(f'{attr}=""', attr, html_output)
-
-    # Preserve original input tag closing style (remove self-closing /)
-    # Only for input tags, keep /> for other self-closing tags
-    html_output = re.sub(r'<input([^>]*)/>', r'<input\1>', html_output)
+    # Roll20's i18n parser rejects. It also writes boolean attributes bare
+    # (readonly instead of readonly="readonly" / readonly="") and leaves
+    # <input> unclosed while keeping /> for other void elements, so the
+    # encoded document needs no post-processing.
+    html_output = soup.encode('utf-8', formatter=Roll20Formatter())
 
     # NOTE: do NOT manually escape/unescape data-i18n attribute values with
     # regex here. Escaping is handled correctly by Roll20Formatter during
@@ -295,67 +409,126 @@ def process_html(html_content, config=None):
     # escaping (&#x27;, &quot;, &amp; left in the output), breaking the match
     # between the data-i18n value and the translations.json key.
 
-    return html_output
+    return html_output, keys
+
+def translate_file(input_file, output_file, config=None):
+    """
+    Read an HTML file, process it and write the result to output_file.
+    Returns the set of translation keys found in that file.
+    """
+    logger.info(f"Reading input file: {input_file}")
+    # Text mode: strict UTF-8 (invalid input raises UnicodeDecodeError) and
+    # CRLF line endings normalized, so the output never mixes line endings
+    with open(input_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+        html_content = f.read()
+
+    processed, keys = process_html(html_content, config)
+
+    logger.info(f"Writing processed HTML to: {output_file}")
+    with open(output_file, 'wb', buffering=IO_BUFFER_SIZE) as f:
+        f.write(processed)
+    return keys
+
+def write_translations(path, keys):
+    """
+    Write the translation keys as sorted JSON (2-space indent), mapping each
+    key to itself. Uses orjson when it is installed, otherwise the standard
+    json module; both produce the same bytes.
+    """
+    # Sort once here; the serializers then keep insertion order
+    keys = {key: key for key in sorted(keys)}
+    if orjson is not None:
+        data = orjson.dumps(keys, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(keys, ensure_ascii=False, indent=2).encode('utf-8')
+    # Binary mode, so the line endings don't depend on the platform either
+    with open(path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+        f.write(data)
+
+def positive_int(value):
+    """
+    argparse type for counts that must be at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description='Extract and prepare HTML content for translation')
-    parser.add_argument('input', nargs='?', default='Earthdawn.html',
-                        help='Input HTML file (default: Earthdawn.html)')
+    parser.add_argument('input', nargs='*', default=['Earthdawn.html'],
+                        help='Input HTML file(s) (default: Earthdawn.html)')
     parser.add_argument('-o', '--output', default=None,
-                        help='Output HTML file (default: input_translated.html)')
+                        help='Output HTML file, single input only (default: input_translated.html)')
     parser.add_argument('-t', '--translations', default='translations.json',
                         help='Output translations JSON file (default: translations.json)')
     parser.add_argument('--skip-tags', nargs='+', default=None,
                         help='Additional tags to skip during processing')
     parser.add_argument('--preserved-tags', nargs='+', default=None,
                         help='Additional formatting tags to preserve')
+    parser.add_argument('--parser', choices=['html.parser', 'lxml'], default='html.parser',
+                        help='BeautifulSoup parser backend; lxml is faster but needs the lxml package (default: html.parser)')
     parser.add_argument('--keep-original-attrs', action='store_true',
                         help='Keep original attributes alongside i18n attributes')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=None,
+                        help='Worker processes for multiple input files (default: number of CPUs)')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Enable verbose logging')
 
     args = parser.parse_args()
+    if args.output is not None and len(args.input) > 1:
+        parser.error('--output can only be used with a single input file')
 
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
     # Setup configuration
     config = {
-        'remove_original_attrs': not args.keep_original_attrs
+        'remove_original_attrs': not args.keep_original_attrs,
+        'parser': args.parser
     }
     if args.skip_tags:
         config['skipped_tags'] = SKIPPED_TAGS | set(args.skip_tags)
     if args.preserved_tags:
         config['preserved_tags'] = PRESERVED_FORMATTING_TAGS | set(args.preserved_tags)
 
-    # Determine output filename
-    if args.output is None:
-        input_path = Path(args.input)
-        output_file = input_path.stem + '_translated' + input_path.suffix
-    else:
-        output_file = args.output
+    # Determine output filenames
+    files = []
+    outputs = {}
+    for input_file in args.input:
+        if args.output is None:
+            input_path = Path(input_file)
+            output_file = input_path.stem + '_translated' + input_path.suffix
+        else:
+            output_file = args.output
+        # Outputs go to the current directory, so inputs with the same name
+        # would overwrite each other's result
+        resolved = Path(output_file).resolve()
+        if resolved in outputs:
+            parser.error(f"{outputs[resolved]} and {input_file} would both be written to {output_file}")
+        outputs[resolved] = input_file
+        files.append((input_file, output_file))
 
     try:
-        # Read input file
-        logger.info(f"Reading input file: {args.input}")
-        with open(args.input, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        # Process HTML
-        processed = process_html(html_content, config)
-
-        # Write output HTML
-        logger.info(f"Writing processed HTML to: {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(processed)
+        # Process HTML - files are independent, so several inputs are
+        # processed in parallel and their keys merged
+        keys = set()
+        if len(files) > 1 and args.jobs != 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                futures = [executor.submit(translate_file, input_file, output_file, config)
+                           for input_file, output_file in files]
+                for future in futures:
+                    keys |= future.result()
+        else:
+            for input_file, output_file in files:
+                keys |= translate_file(input_file, output_file, config)
 
         # Write translations JSON
         logger.info(f"Writing translations to: {args.translations}")
-        with open(args.translations, 'w', encoding='utf-8') as f:
-            json.dump(translation_keys, f, ensure_ascii=False, indent=4, sort_keys=True)
+        write_translations(args.translations, keys)
 
         logger.info("Processing completed successfully!")
-        logger.info(f"Extracted {len(translation_keys)} unique translation keys")
+        logger.info(f"Extracted {len(keys)} unique translation keys")
 
     except FileNotFoundError as e:
         logger.error(f"File not found: {e.filename}")